@@ -17,6 +17,8 @@ from .types import DataProvider, DrawingContext, ElementType
 
 _LOGGER = logging.getLogger(__name__)
 
+_ICON_TYPES = frozenset({ElementType.ICON.value, ElementType.ICON_SEQUENCE.value})
+
 
 async def generate_image(
     width: int,
@@ -74,6 +76,13 @@ async def generate_image(
         pos_y=0,
     )
 
+    # Load MDI fonts for every icon size up front so icon handlers only hit warm caches
+    icons.prewarm(
+        element.get("size")
+        for element in elements
+        if isinstance(element, dict) and element.get("type") in _ICON_TYPES and element.get("visible", True)
+    )
+
     # Get all registered handlers
     draw_handlers = {element_type: handler for element_type, (handler, _) in get_all_handlers().items()}
 
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -19,20 +20,44 @@ from odl_renderer.types import DrawingContext, ElementType
 
 _LOGGER = logging.getLogger(__name__)
 
+_ASSETS_DIR = Path(__file__).parent.parent / "assets"
+_FONT_PATH = _ASSETS_DIR / "materialdesignicons-webfont.ttf"
+
+# Anchor -> (x, y) multipliers of the icon size to subtract from the anchor point.
+_ANCHOR_OFFSETS: dict[str, tuple[float, float]] = {
+    "mm": (0.5, 0.5),
+    "tl": (0.0, 0.0),
+    "tr": (1.0, 0.0),
+    "bl": (0.0, 1.0),
+    "br": (1.0, 1.0),
+    "mt": (0.5, 0.0),
+    "mb": (0.5, 1.0),
+    "lm": (0.0, 0.5),
+    "rm": (1.0, 0.5),
+}
+
+# Icon sequence direction -> (x, y) unit step between consecutive icons.
+_DIRECTION_STEPS: dict[str, tuple[int, int]] = {
+    "right": (1, 0),
+    "left": (-1, 0),
+    "down": (0, 1),
+    "up": (0, -1),
+}
+
 
 def _build_mdi_index() -> dict[str, str]:
     """Load the MDI icon index from the bundled metadata file.
 
-    The metadata is stored as a pre-flattened ``{name: codepoint}`` dict so this
-    is a direct JSON load with no transformation. Called once at module import time
-    so the blocking ``open()`` happens in an executor, not during an async render.
+    The metadata is stored as a pre-flattened ``{name: codepoint}`` dict (aliases
+    included). Hex codepoints are decoded to their glyph characters here so the
+    render path is a single dict lookup. Called once at module import time so the
+    blocking file read happens in an executor, not during an async render.
     """
-    assets_dir = Path(__file__).parent.parent / "assets"
-    metadata_path = assets_dir / "materialdesignicons-webfont_meta.json"
+    metadata_path = _ASSETS_DIR / "materialdesignicons-webfont_meta.json"
 
     try:
-        with open(metadata_path, encoding="utf-8") as f:
-            index: dict[str, str] = json.load(f)
+        metadata: dict[str, str] = json.loads(metadata_path.read_bytes())
+        index = {name: chr(int(codepoint, 16)) for name, codepoint in metadata.items()}
     except Exception as err:
         raise ValueError(f"Failed to load MDI metadata: {err}") from err
 
@@ -43,28 +68,40 @@ def _build_mdi_index() -> dict[str, str]:
 # Load once at module import time — no blocking I/O during async renders.
 _mdi_index: dict[str, str] = _build_mdi_index()
 
-# Module-level font cache keyed by size — avoids reloading the TTF on every render.
-_mdi_font_cache: dict[int, ImageFont.FreeTypeFont] = {}
-
 
 def _get_mdi_index() -> dict[str, str]:
-    """Return the pre-loaded MDI icon index."""
+    """Return the pre-loaded MDI icon index mapping names to glyph characters."""
     return _mdi_index
 
 
-def _get_mdi_font(size: int) -> ImageFont.FreeTypeFont:
-    """Return a cached FreeType font for the given size, loading it on first use."""
-    if size not in _mdi_font_cache:
-        assets_dir = Path(__file__).parent.parent / "assets"
-        font_path = assets_dir / "materialdesignicons-webfont.ttf"
+@lru_cache(maxsize=128)
+def _load_mdi_font(size: int) -> ImageFont.FreeTypeFont:
+    """Return a cached FreeType font for the given size, loading it on first use.
+
+    Memoized so repeated icons at the same size share one font object instead of
+    re-opening and re-parsing the TTF on every render.
+    """
+    try:
+        return ImageFont.truetype(str(_FONT_PATH), size)
+    except OSError as err:
+        raise ValueError(f"Failed to load MDI font: {err}") from err
+
+
+def prewarm(sizes: Iterable[Any] = ()) -> None:
+    """Load the MDI fonts for the given icon sizes into the font cache.
+
+    Invalid sizes and font load failures are skipped here and left for the
+    element handler to report with the element index. The icon index itself is
+    already loaded at import time.
+    """
+    for size in {size for size in sizes if isinstance(size, int) and size > 0}:
         try:
-            _mdi_font_cache[size] = ImageFont.truetype(str(font_path), size)
-        except OSError as err:
-            raise ValueError(f"Failed to load MDI font: {err}") from err
-    return _mdi_font_cache[size]
+            _load_mdi_font(size)
+        except ValueError as err:
+            _LOGGER.debug("Skipping MDI font prewarm for size %d: %s", size, err)
 
 
-def _render_mdi_icon(name: str, size: int, color: tuple[int, int, int, int]) -> Image.Image:
+def _render_mdi_icon_uncached(name: str, size: int, color: tuple[int, int, int, int]) -> Image.Image:
     """Render MDI icon to PIL Image.
 
     Args:
@@ -82,31 +119,51 @@ def _render_mdi_icon(name: str, size: int, color: tuple[int, int, int, int]) ->
     if name.startswith("mdi:"):
         name = name[4:]
 
-    # Find codepoint
-    index = _get_mdi_index()
-    codepoint = index.get(name)
-    if not codepoint:
+    # Find glyph character
+    char = _get_mdi_index().get(name)
+    if char is None:
         raise ValueError(f"Icon '{name}' not found. Search icons at https://pictogrammers.com/library/mdi/")
 
-    # Convert hex to character
-    try:
-        char = chr(int(codepoint, 16))
-    except ValueError as err:
-        raise ValueError(f"Invalid codepoint for icon '{name}'") from err
-
     # Load font (cached at module level — no blocking I/O after first use per size)
-    font = _get_mdi_font(size)
+    font = _load_mdi_font(size)
 
-    # Render icon
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    draw.text((size // 2, size // 2), char, font=font, fill=color, anchor="mm", fontmode="1")
+    # Rasterize the glyph once into a single-channel alpha mask (no color conversion)
+    alpha = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(alpha).text((size // 2, size // 2), char, font=font, fill=255, anchor="mm")
+
+    # Solid color fill with the glyph coverage as alpha
+    img = Image.new("RGBA", (size, size), color)
+    img.putalpha(alpha)
 
     return img
 
 
+@lru_cache(maxsize=256)
+def _render_mdi_icon_cached(name: str, size: int, color: tuple[int, int, int, int]) -> Image.Image:
+    """Return a memoized rendering of an MDI icon.
+
+    ``color`` must be a hashable RGBA tuple of ints, as returned by
+    ``ColorResolver.resolve``; equal tuples share a cache entry however the color
+    was specified (e.g. ``"black"`` and ``"#000"``).
+
+    The returned image is shared between callers and must be treated as read-only;
+    it is only ever used as a paste source and mask. Use ``cache_clear()`` to reset.
+    """
+    return _render_mdi_icon_uncached(name, size, color)
+
+
+def _anchor_offset(anchor: str, size: int) -> tuple[int, int]:
+    """Return the (dx, dy) to subtract from an anchor point to get the top-left corner."""
+    offset = _ANCHOR_OFFSETS.get(anchor)
+    if offset is None:
+        _LOGGER.warning(f"Unknown anchor '{anchor}', using top-left")
+        return 0, 0
+    mx, my = offset
+    return int(mx * size), int(my * size)
+
+
 @element_handler(ElementType.ICON, requires=["x", "y", "value", "size"])
-async def draw_icon(ctx: DrawingContext, element: dict[str, Any]) -> None:
+def draw_icon(ctx: DrawingContext, element: dict[str, Any]) -> None:
     """Draw Material Design Icon.
 
     Renders an icon from the bundled MDI font (10,000+ icons).
@@ -134,30 +191,11 @@ async def draw_icon(ctx: DrawingContext, element: dict[str, Any]) -> None:
     anchor = element.get("anchor", "mm")
 
     # Render icon
-    icon_img = _render_mdi_icon(name, size, color)
+    icon_img = _render_mdi_icon_cached(name, size, color)
 
     # Calculate paste position based on anchor
-    if anchor == "mm":
-        paste_x, paste_y = x - size // 2, y - size // 2
-    elif anchor == "tl":
-        paste_x, paste_y = x, y
-    elif anchor == "tr":
-        paste_x, paste_y = x - size, y
-    elif anchor == "bl":
-        paste_x, paste_y = x, y - size
-    elif anchor == "br":
-        paste_x, paste_y = x - size, y - size
-    elif anchor == "mt":
-        paste_x, paste_y = x - size // 2, y
-    elif anchor == "mb":
-        paste_x, paste_y = x - size // 2, y - size
-    elif anchor == "lm":
-        paste_x, paste_y = x, y - size // 2
-    elif anchor == "rm":
-        paste_x, paste_y = x - size, y - size // 2
-    else:
-        _LOGGER.warning(f"Unknown anchor '{anchor}', using top-left")
-        paste_x, paste_y = x, y
+    dx, dy = _anchor_offset(anchor, size)
+    paste_x, paste_y = x - dx, y - dy
 
     # Paste icon
     ctx.img.paste(icon_img, (paste_x, paste_y), icon_img)
@@ -165,7 +203,7 @@ async def draw_icon(ctx: DrawingContext, element: dict[str, Any]) -> None:
 
 
 @element_handler(ElementType.ICON_SEQUENCE, requires=["x", "y", "icons", "size"])
-async def draw_icon_sequence(ctx: DrawingContext, element: dict[str, Any]) -> None:
+def draw_icon_sequence(ctx: DrawingContext, element: dict[str, Any]) -> None:
     """Draw a sequence of MDI icons.
 
     Renders multiple icons in a row with consistent spacing.
@@ -194,41 +232,34 @@ async def draw_icon_sequence(ctx: DrawingContext, element: dict[str, Any]) -> No
     color = ctx.colors.resolve(element.get("color") or element.get("fill", "black")) or BLACK
     anchor = element.get("anchor", "mm")
     direction = element.get("direction", "right")
+    dx, dy = _anchor_offset(anchor, size)
 
-    current_x, current_y = x_start, y_start
-    max_x, max_y = x_start, y_start
-
-    # Draw each icon
+    # Render all icons up front; skipped icons don't advance the position
+    icon_imgs = []
     for name in element["icons"]:
         try:
-            icon_img = _render_mdi_icon(name, size, color)
+            icon_imgs.append(_render_mdi_icon_cached(name, size, color))
         except ValueError as err:
             _LOGGER.warning(f"Skipping icon '{name}': {err}")
-            continue
-
-        # Calculate paste position
-        if anchor == "mm":
-            paste_x, paste_y = current_x - size // 2, current_y - size // 2
-        elif anchor == "tl":
-            paste_x, paste_y = current_x, current_y
-        else:
-            paste_x, paste_y = current_x, current_y
-
-        # Paste icon
-        ctx.img.paste(icon_img, (paste_x, paste_y), icon_img)
-
-        # Track bounds
-        max_x = max(max_x, paste_x + size)
-        max_y = max(max_y, paste_y + size)
-
-        # Move to next position
-        if direction == "right":
-            current_x += size + spacing
-        elif direction == "left":
-            current_x -= size + spacing
-        elif direction == "down":
-            current_y += size + spacing
-        elif direction == "up":
-            current_y -= size + spacing
-
-    ctx.pos_y = max_y
+
+    if not icon_imgs:
+        ctx.pos_y = y_start
+        return
+
+    # Offset of the last icon relative to the first
+    step_x, step_y = _DIRECTION_STEPS.get(direction, (0, 0))
+    span_x = step_x * (size + spacing) * (len(icon_imgs) - 1)
+    span_y = step_y * (size + spacing) * (len(icon_imgs) - 1)
+    min_x, min_y = min(0, span_x), min(0, span_y)
+
+    # Composite the whole sequence into one strip, then paste it onto the canvas once
+    strip = Image.new("RGBA", (abs(span_x) + size, abs(span_y) + size), (0, 0, 0, 0))
+    for i, icon_img in enumerate(icon_imgs):
+        offset_x = step_x * (size + spacing) * i - min_x
+        offset_y = step_y * (size + spacing) * i - min_y
+        strip.alpha_composite(icon_img, (offset_x, offset_y))
+
+    paste_x, paste_y = x_start - dx + min_x, y_start - dy + min_y
+    ctx.img.paste(strip, (paste_x, paste_y), strip)
+
+    ctx.pos_y = max(y_start, paste_y + strip.height)
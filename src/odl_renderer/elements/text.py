@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any, List, Tuple
 
 from PIL import ImageDraw, ImageFont
@@ -11,6 +12,14 @@ from odl_renderer.types import DrawingContext, ElementType, TextSegment
 
 _LOGGER = logging.getLogger(__name__)
 
+# Matches "[color]text[/color]" for named colors and #RGB / #RRGGBB hex tags
+_COLOR_MARKUP_RE = re.compile(
+    r"\[(black|b|white|w|red|r|yellow|y|blue|bl|green|gr|g|accent|a|"
+    r"half_black|half_white|half_red|half_yellow|half_accent|gray|grey|"
+    r"hb|hw|hr|hy|ha|#[0-9A-Fa-f]{3}|#[0-9A-Fa-f]{6})\](.*?)\[/\1\]",
+    re.DOTALL,
+)
+
 
 @element_handler(ElementType.TEXT, requires=["x", "value"])
 async def draw_text(ctx: DrawingContext, element: dict[str, Any]) -> None:
@@ -273,27 +282,33 @@ def parse_colored_text(text: str) -> List[TextSegment]:
         List[TextSegment]: List of text segments with colors
     """
 
-    segments = []
+    return [TextSegment(text=segment_text, color=color) for segment_text, color in _split_color_markup(text)]
+
+
+@lru_cache(maxsize=512)
+def _split_color_markup(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Split color markup into immutable (text, color) pairs.
+
+    Memoized on the raw string since identical labels are re-rendered often.
+    Returns tuples rather than TextSegments because segments are mutated during
+    layout (start_x) and must not be shared between calls.
+    """
+    parts: List[Tuple[str, str]] = []
     current_pos = 0
-    pattern = (
-        r"\[(black|b|white|w|red|r|yellow|y|blue|bl|green|gr|g|accent|a|"
-        r"half_black|half_white|half_red|half_yellow|half_accent|gray|grey|"
-        r"hb|hw|hr|hy|ha|#[0-9A-Fa-f]{3}|#[0-9A-Fa-f]{6})\](.*?)\[/\1\]"
-    )
 
-    for match in re.finditer(pattern, text, re.DOTALL):
+    for match in _COLOR_MARKUP_RE.finditer(text):
         # Add any text before the match with default color
         if match.start() > current_pos:
-            segments.append(TextSegment(text=text[current_pos : match.start()], color="black"))
+            parts.append((text[current_pos : match.start()], "black"))
         # Add the matched text with the specified color
-        segments.append(TextSegment(text=match.group(2), color=match.group(1)))
+        parts.append((match.group(2), match.group(1)))
         current_pos = match.end()
 
     # Add any remaining text with default color
     if current_pos < len(text):
-        segments.append(TextSegment(text=text[current_pos:], color="black"))
+        parts.append((text[current_pos:], "black"))
 
-    return segments
+    return tuple(parts)
 
 
 def calculate_segment_positions(
@@ -1,35 +1,49 @@
 from __future__ import annotations
 
+import inspect
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Coroutine
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, cast
 
 if TYPE_CHECKING:
     from .types import DrawingContext, ElementType
 
-# Type alias for element handler functions
+# Type alias for registered (always awaitable) element handler functions
 _HandlerFn = Callable[..., Coroutine[Any, Any, None]]
 
+# Handlers with no I/O may be plain functions; the registry wrapper awaits only coroutines
+_SyncHandlerFn = Callable[..., None]
+
 # Global registry populated by decorators
 _handlers: dict[ElementType, tuple[_HandlerFn, list[str]]] = {}
 
 
-def element_handler(element_type: ElementType, requires: list[str] | None = None) -> Callable[[_HandlerFn], _HandlerFn]:
+def element_handler(
+    element_type: ElementType, requires: list[str] | None = None
+) -> Callable[[_HandlerFn | _SyncHandlerFn], _HandlerFn]:
     """
     Decorator to register and validate element handlers.
 
+    Handlers may be ``async def`` (for I/O such as HTTP image loading) or plain
+    ``def`` for pure drawing; either way the registered wrapper is awaitable.
+
     Args:
         element_type: The ElementType this handler processes
         requires: List of required element keys (validated before handler runs)
     """
 
-    def decorator(func: _HandlerFn) -> _HandlerFn:
+    def decorator(func: _HandlerFn | _SyncHandlerFn) -> _HandlerFn:
+        is_async = inspect.iscoroutinefunction(func)
+
         @wraps(func)
         async def wrapper(ctx: DrawingContext, element: dict[str, Any]) -> None:
             if requires:
                 missing = [key for key in requires if key not in element]
                 if missing:
                     raise ValueError(f"{element_type.value} requires: {', '.join(missing)}")
-            await func(ctx, element)
+            if is_async:
+                await cast(_HandlerFn, func)(ctx, element)
+            else:
+                func(ctx, element)
 
         _handlers[element_type] = (wrapper, requires or [])
         return wrapper
@@ -13,10 +13,9 @@ def warmup(sizes: tuple[int, ...] = _DEFAULT_SIZES) -> None:
     Importing this module already triggers the MDI index load, so only the
     per-size font files need explicit pre-warming here.
     """
-    from .elements.icons import _get_mdi_font
+    from .elements.icons import prewarm
 
-    for size in sizes:
-        try:
-            _get_mdi_font(size)
-        except Exception:  # noqa: BLE001
-            break
+    try:
+        prewarm(sizes)
+    except Exception:  # noqa: BLE001
+        pass
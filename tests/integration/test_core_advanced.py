@@ -55,3 +55,25 @@ class TestErrorHandling:
                 height=100,
                 elements=[{"type": "dlimg", "x": 0, "y": 0, "url": "relative/bad.png", "xsize": 10, "ysize": 10}],
             )
+
+    async def test_icon_font_load_failure_reports_element(self, monkeypatch, caplog):
+        """Font load errors surface from the icon handler, not the up-front prewarm."""
+        from odl_renderer.elements import icons
+
+        def _fail(*args, **kwargs):
+            raise OSError("cannot open resource")
+
+        monkeypatch.setattr(icons.ImageFont, "truetype", _fail)
+        icons._load_mdi_font.cache_clear()
+        icons._render_mdi_icon_cached.cache_clear()
+        try:
+            with pytest.raises(ValueError, match="Element 1: Failed to load MDI font"):
+                await generate_image(
+                    width=100,
+                    height=100,
+                    elements=[{"type": "icon", "value": "home", "x": 50, "y": 50, "size": 24}],
+                )
+            assert "Element 1: Failed to load MDI font" in caplog.text
+        finally:
+            icons._load_mdi_font.cache_clear()
+            icons._render_mdi_icon_cached.cache_clear()
@@ -1,4 +1,5 @@
 import pytest
+from PIL import ImageOps
 
 from odl_renderer import generate_image
 
@@ -104,3 +105,65 @@ class TestIconSequenceElement:
             ],
         )
         assert image.size == (200, 200)
+
+    @pytest.mark.parametrize(
+        ("anchor", "top_left"),
+        [("tl", (100, 100)), ("mm", (88, 88)), ("br", (76, 76)), ("mb", (88, 76)), ("rm", (76, 88)), ("x", (100, 100))],
+    )
+    async def test_icon_sequence_anchors(self, anchor, top_left):
+        image = await generate_image(
+            width=200,
+            height=200,
+            elements=[
+                {
+                    "type": "icon_sequence",
+                    "x": 100,
+                    "y": 100,
+                    "size": 24,
+                    "icons": [MDI_ICON],
+                    "anchor": anchor,
+                }
+            ],
+        )
+        bbox = ImageOps.invert(image.convert("L")).getbbox()
+        left, top = top_left
+        assert bbox is not None
+        assert left <= bbox[0] and bbox[2] <= left + 24
+        assert top <= bbox[1] and bbox[3] <= top + 24
+
+    @pytest.mark.parametrize(
+        ("direction", "spacing", "region"),
+        [
+            ("right", 0, (100, 100, 172, 124)),
+            ("left", 0, (52, 100, 124, 124)),
+            ("down", 0, (100, 100, 124, 172)),
+            ("right", -10, (100, 100, 152, 124)),
+            ("right", -24, (100, 100, 124, 124)),
+        ],
+    )
+    async def test_icon_sequence_extent(self, direction, spacing, region):
+        """Icons are laid out contiguously; unknown icons are skipped without leaving a gap."""
+        image = await generate_image(
+            width=200,
+            height=200,
+            elements=[
+                {
+                    "type": "icon_sequence",
+                    "x": 100,
+                    "y": 100,
+                    "size": 24,
+                    "spacing": spacing,
+                    "icons": [MDI_ICON, "nonexistent_icon_xyz", MDI_ICON, MDI_ICON],
+                    "anchor": "tl",
+                    "direction": direction,
+                }
+            ],
+        )
+        bbox = ImageOps.invert(image.convert("L")).getbbox()
+        assert bbox is not None
+        assert region[0] <= bbox[0] < region[0] + 24
+        assert region[2] - 24 < bbox[2] <= region[2]
+        assert region[1] <= bbox[1] and bbox[3] <= region[3]
+        # The sequence is pasted as one strip, so overlapping icons lower the canvas
+        # alpha at most once (masked paste floor a*a/255 + 255 - a >= ~191)
+        assert image.getchannel("A").getextrema()[0] >= 190
@@ -0,0 +1,71 @@
+"""Unit tests for MDI icon rendering helpers."""
+
+from __future__ import annotations
+
+import pytest
+from PIL import ImageFont
+
+from odl_renderer.colors import ColorResolver
+from odl_renderer.elements.icons import _get_mdi_index, _load_mdi_font, _render_mdi_icon_cached, prewarm
+
+
+class TestMdiFont:
+    def test_font_is_freetype(self):
+        assert isinstance(_load_mdi_font(24), ImageFont.FreeTypeFont)
+
+    def test_font_is_cached_per_size(self):
+        assert _load_mdi_font(24) is _load_mdi_font(24)
+        assert _load_mdi_font(24) is not _load_mdi_font(32)
+
+
+class TestRenderMdiIconCached:
+    def setup_method(self):
+        _render_mdi_icon_cached.cache_clear()
+
+    def test_repeated_render_returns_same_image(self):
+        img1 = _render_mdi_icon_cached("home", 24, (0, 0, 0, 255))
+        img2 = _render_mdi_icon_cached("home", 24, (0, 0, 0, 255))
+        assert img1 is img2
+        assert img1.size == (24, 24)
+
+    def test_different_color_renders_separately(self):
+        black = _render_mdi_icon_cached("home", 24, (0, 0, 0, 255))
+        red = _render_mdi_icon_cached("home", 24, (255, 0, 0, 255))
+        assert black is not red
+
+    def test_equivalent_colors_share_cache_entry(self):
+        resolver = ColorResolver()
+        _render_mdi_icon_cached("home", 24, resolver.resolve("black"))
+        _render_mdi_icon_cached("home", 24, resolver.resolve("#000"))
+        info = _render_mdi_icon_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_unknown_icon_raises(self):
+        with pytest.raises(ValueError):
+            _render_mdi_icon_cached("nonexistent_icon_xyz", 24, (0, 0, 0, 255))
+
+
+class TestMdiIndex:
+    def test_index_stores_decoded_characters(self):
+        char = _get_mdi_index()["home"]
+        assert len(char) == 1
+        assert ord(char) > 0xF0000
+
+    def test_aliases_share_glyph(self):
+        index = _get_mdi_index()
+        assert index["abjad-arabic"] == index["writing-system-arabic"]
+
+
+class TestPrewarm:
+    def setup_method(self):
+        _load_mdi_font.cache_clear()
+
+    def test_prewarm_loads_each_size_once(self):
+        prewarm([20, 20, 28])
+        info = _load_mdi_font.cache_info()
+        assert info.currsize == 2
+        assert info.misses == 2
+
+    def test_prewarm_ignores_invalid_sizes(self):
+        prewarm([0, -4, "24", None])
+        assert _load_mdi_font.cache_info().currsize == 0
@@ -20,3 +20,21 @@ def test_parse_colored_text_supports_hex_tags():
 
     assert [segment.text for segment in segments] == ["G", "H"]
     assert [segment.color for segment in segments] == ["#0f0", "#00FFAA"]
+
+
+def test_parse_colored_text_returns_fresh_segments_for_repeated_text():
+    first = parse_colored_text("A [red]B[/red]")
+    first[1].start_x = 42
+
+    second = parse_colored_text("A [red]B[/red]")
+
+    assert [segment.text for segment in second] == ["A ", "B"]
+    assert second[1] is not first[1]
+    assert second[1].start_x == 0
+
+
+def test_parse_colored_text_leaves_unmatched_tags_as_text():
+    segments = parse_colored_text("[red]open [blue]x[/red]")
+
+    assert [segment.text for segment in segments] == ["open [blue]x"]
+    assert [segment.color for segment in segments] == ["red"]